@@ -0,0 +1,19 @@
+import os
+import time
+import uuid
+
+
+def uuid7(*, timestamp_ms: int | None = None) -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): a 48-bit Unix timestamp in
+    milliseconds followed by random bits, so new primary keys land at the
+    right-hand edge of the B-tree index instead of at random pages.
+    """
+    if timestamp_ms is None:
+        timestamp_ms = time.time_ns() // 1_000_000
+    value = int.from_bytes(timestamp_ms.to_bytes(6, "big") + os.urandom(10), "big")
+    value &= ~(0xF000 << 64)
+    value |= 0x7000 << 64
+    value &= ~(0xC000 << 48)
+    value |= 0x8000 << 48
+    return uuid.UUID(int=value)
@@ -0,0 +1,19 @@
+import uuid
+
+from app.core.ids import uuid7
+
+
+def test_uuid7_version_and_variant() -> None:
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_embeds_timestamp() -> None:
+    timestamp_ms = 1_700_000_000_123
+    assert uuid7(timestamp_ms=timestamp_ms).int >> 80 == timestamp_ms
+
+
+def test_uuid7_ordered_across_milliseconds() -> None:
+    timestamp_ms = 1_700_000_000_123
+    assert uuid7(timestamp_ms=timestamp_ms) < uuid7(timestamp_ms=timestamp_ms + 1)
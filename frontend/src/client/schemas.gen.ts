@@ -321,7 +321,6 @@ export const UserPublicSchema = {
         email: {
             type: 'string',
             maxLength: 255,
-            format: 'email',
             title: 'Email'
         },
         is_active: {